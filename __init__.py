@@ -1,5 +1,3 @@
-import bpy
-
 from . import preferences, update
 from . import tools
 
@@ -9,7 +7,6 @@ def register():
     for mod in modules:
         if hasattr(mod, "register"):
             mod.register()
-    bpy.app.timers.register(update.check_for_updates, first_interval=3.0)
 
 def unregister():
     for mod in modules:
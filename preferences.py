@@ -3,17 +3,9 @@ import bpy
 from .manifest import manifest
 from .enums import UpdateChannel
 
-def get_addon_prefs():
-    wm = bpy.context.window_manager
-    return wm.get(f"{manifest.id}_prefs", {})
-
-
-def set_addon_pref(key, value):
-    wm = bpy.context.window_manager
-    prefs = wm.get(f"{manifest.id}_prefs", {})
-    prefs[key] = value
-    wm[f"{manifest.id}_prefs"] = prefs
-
+def _on_update_settings_change(self, context):
+    from .update import cache_preferences
+    cache_preferences(UpdateChannel(self.gridit_update_channel_sel), self.gridit_auto_update)
 
 class GridItPreferences(bpy.types.Panel):
     bl_extension_id = manifest.id
@@ -28,7 +20,8 @@ class GridItPreferences(bpy.types.Panel):
         bpy.types.WindowManager.gridit_auto_update = bpy.props.BoolProperty(
             name="Automatic Updates",
             description="Automatically install updates",
-            default=True
+            default=True,
+            update=_on_update_settings_change
         )
         bpy.types.WindowManager.gridit_update_channel_sel = bpy.props.EnumProperty(
             name="Update Channel",
@@ -38,7 +31,8 @@ class GridItPreferences(bpy.types.Panel):
                 (UpdateChannel.BETA.value, "Beta", "Install beta versions as well"),
                 (UpdateChannel.DEV.value, "Dev", "Get all development updates")
             ],
-            default=UpdateChannel.STABLE.value
+            default=UpdateChannel.STABLE.value,
+            update=_on_update_settings_change
         )
 
     @classmethod
@@ -99,10 +93,4 @@ classes = (
     GRIDIT_OT_CheckUpdates
 )
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
\ No newline at end of file
+register, unregister = bpy.utils.register_classes_factory(classes)
\ No newline at end of file
@@ -2,10 +2,13 @@ from . import grid_by_world
 
 modules = [grid_by_world]
 
+_registers = tuple(mod.register for mod in modules)
+_unregisters = tuple(mod.unregister for mod in reversed(modules))
+
 def register():
-    for mod in modules:
-        mod.register()
+    for fn in _registers:
+        fn()
 
 def unregister():
-    for mod in modules:
-        mod.unregister()
\ No newline at end of file
+    for fn in _unregisters:
+        fn()
\ No newline at end of file
@@ -1,13 +1,19 @@
 import bpy
 import bmesh
 import math
+import numpy as np
 from mathutils import Vector
+from mathutils.kdtree import KDTree
 from bpy.types import Panel, Operator, PropertyGroup
 from bpy.props import FloatProperty
-from collections import defaultdict
 
 from ..manifest import manifest
 
+try:
+    from ._pip_numba import winding_batch
+except ImportError:  # Numba is optional; fall back to the NumPy implementation
+    winding_batch = None
+
 class GridByWorldSettings(PropertyGroup):
     grid_world_size: FloatProperty(
         name="Face Size",
@@ -47,7 +53,7 @@ class GRIDIT_OT_GridByWorld(Operator):
         run(settings.grid_world_size)
         return {'FINISHED'}
 
-def extract_boundary_loop(bm: bmesh.types.BMesh, obj: bpy.types.Object) -> list[Vector]:
+def extract_boundary_loop(mesh: bpy.types.Mesh, obj: bpy.types.Object) -> list[Vector]:
     """Return an ordered list of boundary vertices in world space.
 
     Only the first (outermost) loop is returned.  The orientation of the
@@ -55,8 +61,8 @@ def extract_boundary_loop(bm: bmesh.types.BMesh, obj: bpy.types.Object) -> list[
 
     Parameters
     ----------
-    bm : :class:`bmesh.types.BMesh`
-        The bmesh from which to extract boundary edges.
+    mesh : :class:`bpy.types.Mesh`
+        The mesh from which to extract boundary edges.
     obj : :class:`bpy.types.Object`
         The object whose world matrix is applied.
 
@@ -65,40 +71,48 @@ def extract_boundary_loop(bm: bmesh.types.BMesh, obj: bpy.types.Object) -> list[
     list[:class:`mathutils.Vector`]
         A list of 2D vectors representing the boundary in world XY space.
     """
-    # Build adjacency mapping from vertices to their boundary edges
-    boundary_edges = [e for e in bm.edges if e.is_boundary]
-    if not boundary_edges:
+    # Count the faces using each edge in bulk from the loop data; boundary
+    # edges are the ones used by exactly one face
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    face_count = np.bincount(loop_edges, minlength=len(mesh.edges))
+    boundary_edges = np.flatnonzero(face_count == 1)
+    if not len(boundary_edges):
         return []
-
-    adj: defaultdict[int, list[bmesh.types.BMEdge]] = defaultdict(list)
-    for e in boundary_edges:
-        v0 = e.verts[0].index
-        v1 = e.verts[1].index
-        adj[v0].append(e)
-        adj[v1].append(e)
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    edge_verts = edge_verts.reshape(-1, 2)
+
+    # Vertices on a manifold boundary loop have exactly two boundary edges, so
+    # keep two fixed (other vertex, edge index) slots per vertex; (-1, -1)
+    # marks an empty or already consumed slot.  Only boundary vertices get an
+    # entry, so the table stays proportional to the boundary, not the mesh.
+    nxt: dict[int, list[tuple[int, int]]] = {}
+    for e_idx, (v0, v1) in zip(boundary_edges.tolist(), edge_verts[boundary_edges].tolist()):
+        for a, b in ((v0, v1), (v1, v0)):
+            slots = nxt.setdefault(a, [(-1, -1), (-1, -1)])
+            if slots[0][1] == -1:
+                slots[0] = (b, e_idx)
+            elif slots[1][1] == -1:
+                slots[1] = (b, e_idx)
 
     # Choose an arbitrary starting edge and vertex
-    start_edge = boundary_edges[0]
-    start_vert_idx = start_edge.verts[0].index
+    start_vert_idx = int(edge_verts[boundary_edges[0], 0])
 
     loop_indices = [start_vert_idx]
     current_vert = start_vert_idx
-    visited_edges: set[int] = set()
 
     while True:
-        # find next unvisited boundary edge incident to current vertex
-        next_edge = None
-        for e in adj[current_vert]:
-            if e.index not in visited_edges:
-                next_edge = e
-                break
-        if next_edge is None:
+        # take the next unconsumed boundary edge incident to current vertex
+        slots = nxt[current_vert]
+        k = 0 if slots[0][1] != -1 else 1
+        next_vert_idx, edge_idx = slots[k]
+        if edge_idx == -1:
             break
-        visited_edges.add(next_edge.index)
-        # determine other vertex of the edge
-        v0 = next_edge.verts[0].index
-        v1 = next_edge.verts[1].index
-        next_vert_idx = v1 if v0 == current_vert else v0
+        # consume the edge from both of its ends
+        slots[k] = (-1, -1)
+        other = nxt[next_vert_idx]
+        other[0 if other[0][1] == edge_idx else 1] = (-1, -1)
         current_vert = next_vert_idx
         if current_vert == loop_indices[0]:
             # Closed loop
@@ -108,166 +122,283 @@ def extract_boundary_loop(bm: bmesh.types.BMesh, obj: bpy.types.Object) -> list[
     # Convert vertex indices to world‐space XY coordinates
     world_coords = []
     for vi in loop_indices:
-        v = bm.verts[vi]
+        v = mesh.vertices[vi]
         world_co = obj.matrix_world @ v.co
         world_coords.append(Vector((world_co.x, world_co.y)))
     return world_coords
 
-def point_in_polygon(point: Vector, polygon: list[Vector]) -> bool:
-    """Determine whether a 2D point is inside a polygon.
+def points_in_polygon_np(points: np.ndarray, polygon: np.ndarray, block: int = 4096) -> np.ndarray:
+    """Determine which of many 2D points lie inside a polygon.
+
+    Implements the winding number algorithm.  Every query point is tested
+    against every polygon edge at once using broadcasting, so the winding
+    number of the whole batch is computed without a Python-level loop.  Points
+    are processed ``block`` at a time so the temporary (block, N) arrays stay
+    small however many points are queried.
 
-    Implements the winding number algorithm.  Points exactly on the
-    boundary return True.
+    Only the strict interior is reported: points exactly on the boundary count
+    as outside.  The grid builder gets a boundary vertex at each of those
+    positions from :func:`slice_boundary_at_grid`, so keeping them as grid
+    points as well would create coincident vertices.
 
     Parameters
     ----------
-    point : :class:`mathutils.Vector`
-        The point to test (x,y).
-    polygon : list[:class:`mathutils.Vector`]
-        A sequence of vertices describing the polygon.
+    points : :class:`numpy.ndarray`
+        Array of shape (M, 2) holding the query points (x,y).
+    polygon : :class:`numpy.ndarray`
+        Array of shape (N, 2) holding the polygon vertices in order.
+    block : int, optional
+        Number of points tested per vectorised pass.
 
     Returns
     -------
-    bool
-        True if the point lies inside or on the boundary, False otherwise.
+    :class:`numpy.ndarray`
+        Boolean array of shape (M,), True where the point lies strictly
+        inside the polygon.
     """
+    poly_next = np.roll(polygon, -1, axis=0)
+    x1 = polygon[:, 0][None, :]
+    y1 = polygon[:, 1][None, :]
+    x2 = poly_next[:, 0][None, :]
+    y2 = poly_next[:, 1][None, :]
+    x_lo = np.minimum(x1, x2) - 1e-9
+    x_hi = np.maximum(x1, x2) + 1e-9
+    y_lo = np.minimum(y1, y2) - 1e-9
+    y_hi = np.maximum(y1, y2) + 1e-9
+    inside = np.empty(len(points), dtype=np.bool_)
+    for s in range(0, len(points), block):
+        px = points[s:s + block, 0, None]
+        py = points[s:s + block, 1, None]
+        # Side of edge (p1, p2) the point lies on, for every (point, edge)
+        # pair: > 0 left, < 0 right, 0 collinear.  Shape (block, N)
+        left = (x2 - x1) * (py - y1) - (px - x1) * (y2 - y1)
+        on_edge = (np.abs(left) < 1e-9) & (x_lo <= px) & (px <= x_hi) & (y_lo <= py) & (py <= y_hi)
+        dy1 = y1 <= py
+        dy2 = y2 > py
+        upward = dy1 & dy2 & (left > 0)
+        downward = ~dy1 & ~dy2 & (left < 0)
+        wn = upward.sum(axis=1) - downward.sum(axis=1)
+        inside[s:s + block] = (wn != 0) & ~on_edge.any(axis=1)
+    return inside
+
+def points_in_polygon_batch(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """Test many points against a polygon using the fastest available backend.
+
+    Uses the Numba kernel from :mod:`._pip_numba` when Numba is installed and
+    :func:`points_in_polygon_np` otherwise.  Arguments and return value are
+    the same as for :func:`points_in_polygon_np`.
+    """
+    if winding_batch is not None:
+        return winding_batch(np.ascontiguousarray(points[:, 0], dtype=np.float64),
+                             np.ascontiguousarray(points[:, 1], dtype=np.float64),
+                             np.ascontiguousarray(polygon[:, 0], dtype=np.float64),
+                             np.ascontiguousarray(polygon[:, 1], dtype=np.float64))
+    return points_in_polygon_np(points, polygon)
+
+def scanline_inside_mask(polygon: np.ndarray, x_lines: np.ndarray, y_lines: np.ndarray) -> np.ndarray:
+    """Classify every grid point as inside or outside a polygon, row by row.
+
+    For each horizontal grid line the polygon is intersected once to obtain
+    its sorted x-crossings; the grid points between each odd/even pair of
+    crossings are inside.  This needs one pass over the polygon per row
+    rather than per point.  Only the first and last point of each run, which
+    may sit exactly on a crossing, are checked with the full
+    :func:`points_in_polygon_batch` test; the rest of the run is trivially
+    inside.  Rows that pass through a polygon vertex may run along a
+    horizontal edge and are tested point by point.  Points on the boundary
+    count as outside just like in :func:`points_in_polygon_np`.
+
+    Parameters
+    ----------
+    polygon : :class:`numpy.ndarray`
+        Array of shape (N, 2) holding the polygon vertices in order.
+    x_lines : :class:`numpy.ndarray`
+        Evenly spaced x coordinates of the vertical grid lines.
+    y_lines : :class:`numpy.ndarray`
+        Evenly spaced y coordinates of the horizontal grid lines.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Boolean array of shape (len(x_lines), len(y_lines)).
     """
-    Implementation notes:
+    x_count = len(x_lines)
+    inside = np.zeros((x_count, len(y_lines)), dtype=np.bool_)
+    poly_next = np.roll(polygon, -1, axis=0)
+    x1, y1 = polygon[:, 0], polygon[:, 1]
+    x2, y2 = poly_next[:, 0], poly_next[:, 1]
+    # Grid cells (i, j) that need the full point-in-polygon test
+    check_i: list[np.ndarray] = []
+    check_j: list[np.ndarray] = []
+    for j, y_val in enumerate(y_lines):
+        if np.any(np.abs(y1 - y_val) < 1e-9):
+            check_i.append(np.arange(x_count))
+            check_j.append(np.full(x_count, j))
+            continue
+        # Half-open rule: horizontal edges never cross, shared vertices cross once
+        crosses = (y1 <= y_val) != (y2 <= y_val)
+        t = (y_val - y1[crosses]) / (y2[crosses] - y1[crosses])
+        xs = np.sort(x1[crosses] + t * (x2[crosses] - x1[crosses]))
+        # First and last grid line inside each crossing pair
+        i_lo = np.searchsorted(x_lines, xs[0::2], side="left")
+        i_hi = np.searchsorted(x_lines, xs[1::2], side="right") - 1
+        run = i_lo <= i_hi
+        i_lo, i_hi = i_lo[run], i_hi[run]
+        for lo, hi in zip(i_lo.tolist(), i_hi.tolist()):
+            inside[lo + 1:hi, j] = True
+        ends = np.unique(np.concatenate((i_lo, i_hi)))
+        check_i.append(ends)
+        check_j.append(np.full(len(ends), j))
+    if check_i:
+        ci = np.concatenate(check_i)
+        cj = np.concatenate(check_j)
+        pts = np.column_stack((x_lines[ci], y_lines[cj]))
+        inside[ci, cj] = points_in_polygon_batch(pts, polygon)
+    return inside
+
+def compute_grid_extent(boundary: np.ndarray, step: float) -> tuple[float, float, int, int]:
+    """Return the grid lines covering the bounding box of a boundary loop.
+
+    Computed once per run so that slicing and mesh building agree on exactly
+    the same line positions.
+
+    Parameters
+    ----------
+    boundary : :class:`numpy.ndarray`
+        Array of shape (N, 2) holding the boundary vertices.
+    step : float
+        Grid spacing.
 
-    The winding number is incremented or decremented whenever the horizontal
-    ray emanating from ``point`` crosses an edge of the polygon.  Before
-    computing the winding number we test if ``point`` lies exactly on any
-    polygon edge.  This is done by checking colinearity (zero area of the
-    triangle) and bounding box containment.
+    Returns
+    -------
+    tuple[float, float, int, int]
+        ``(start_x, start_y, x_count, y_count)``: the first grid line on each
+        axis and the number of lines along it.
     """
-    wn = 0
-    num = len(polygon)
-    for i in range(num):
-        v1 = polygon[i]
-        v2 = polygon[(i + 1) % num]
-        # Check if point lies exactly on the segment (v1, v2)
-        if abs(is_left(v1, v2, point)) < 1e-9:
-            if (min(v1.x, v2.x) - 1e-9) <= point.x <= (max(v1.x, v2.x) + 1e-9) and \
-                    (min(v1.y, v2.y) - 1e-9) <= point.y <= (max(v1.y, v2.y) + 1e-9):
-                return True
-        # Winding number algorithm
-        if v1.y <= point.y:
-            if v2.y > point.y:  # upward crossing
-                if is_left(v1, v2, point) > 0:
-                    wn += 1
-        else:
-            if v2.y <= point.y:  # downward crossing
-                if is_left(v1, v2, point) < 0:
-                    wn -= 1
-    return wn != 0
-
-def slice_boundary_at_grid(boundary: list[Vector], step: float) -> list[tuple[Vector, int, float]]:
+    # Determine bounding box
+    min_x, min_y = boundary.min(axis=0).tolist()
+    max_x, max_y = boundary.max(axis=0).tolist()
+    # Snap it outwards to grid lines
+    start_x = math.floor(min_x / step) * step
+    end_x = math.ceil(max_x / step) * step
+    start_y = math.floor(min_y / step) * step
+    end_y = math.ceil(max_y / step) * step
+    x_count = int(round((end_x - start_x) / step)) + 1
+    y_count = int(round((end_y - start_y) / step)) + 1
+    return start_x, start_y, x_count, y_count
+
+def slice_boundary_at_grid(boundary: np.ndarray, step: float,
+                           extent: tuple[float, float, int, int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Compute intersections of the boundary edges with the grid lines.
 
     This function identifies where the polygon boundary intersects vertical and
     horizontal grid lines spaced at ``step`` intervals.  Each intersection is
     associated with the index of the boundary segment that produced it and the
     parameter ``t`` along that segment (0 at the start vertex and 1 at the
-    end).  The output list is sorted in ascending order by segment index and
+    end).  The output is sorted in ascending order by segment index and
     parameter.
 
     Parameters
     ----------
-    boundary : list[:class:`mathutils.Vector`]
-        Ordered list of boundary vertices (2D world coordinates).
+    boundary : :class:`numpy.ndarray`
+        Array of shape (N, 2) holding the ordered boundary vertices (2D world
+        coordinates).
     step : float
         Grid spacing.
+    extent : tuple[float, float, int, int]
+        Grid origin and line counts ``(start_x, start_y, x_count, y_count)``
+        as returned by :func:`compute_grid_extent`.
 
     Returns
     -------
-    list[tuple[:class:`mathutils.Vector`, int, float]]
-        A list of intersection data: (point, segment index, param).
+    tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`]
+        Intersection data as parallel arrays: points of shape (K, 2),
+        segment indices and params.
     """
-    # Determine bounding box
-    xs = [v.x for v in boundary]
-    ys = [v.y for v in boundary]
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
-    # Compute grid lines
-    start_x = math.floor(min_x / step) * step
-    end_x = math.ceil(max_x / step) * step
-    start_y = math.floor(min_y / step) * step
-    end_y = math.ceil(max_y / step) * step
-    x_lines = [start_x + i * step for i in range(int(round((end_x - start_x) / step)) + 1)]
-    y_lines = [start_y + j * step for j in range(int(round((end_y - start_y) / step)) + 1)]
-    # Dictionary to collect unique intersections keyed by rounded coordinate
-    inter_dict: dict[tuple[float, float], tuple[Vector, int, float]] = {}
-    num = len(boundary)
-    for i in range(num):
-        p1 = boundary[i]
-        p2 = boundary[(i + 1) % num]
-        segment_vec = p2 - p1
-        # Skip degenerate edges
-        if segment_vec.length < 1e-12:
-            continue
-        # Check intersections with vertical lines x = const
-        for x_val in x_lines:
-            # Does the segment cross the vertical line?
-            if (p1.x - x_val) * (p2.x - x_val) <= 0:
-                # Compute intersection parameter t
-                # If p1.x == p2.x (vertical segment) avoid division by zero
-                if abs(p2.x - p1.x) > 1e-12:
-                    t = (x_val - p1.x) / (p2.x - p1.x)
-                    if 0.0 <= t <= 1.0:
-                        y_int = p1.y + t * (p2.y - p1.y)
-                        # Ensure the intersection lies on the segment (check y bounds)
-                        if (min(p1.y, p2.y) - 1e-9) <= y_int <= (max(p1.y, p2.y) + 1e-9):
-                            pt = Vector((float(x_val), float(y_int)))
-                            key = (round(pt.x, 8), round(pt.y, 8))
-                            # Keep the first occurrence for this coordinate
-                            if key not in inter_dict:
-                                inter_dict[key] = (pt, i, t)
-                else:
-                    # Segment is vertical and coincides with the grid line; handle intersections at endpoints only
-                    if abs(p1.x - x_val) < 1e-9:
-                        # Add both endpoints (t=0 and t=1)
-                        for t_val, y_val in [(0.0, p1.y), (1.0, p2.y)]:
-                            pt = Vector((float(x_val), float(y_val)))
-                            key = (round(pt.x, 8), round(pt.y, 8))
-                            if key not in inter_dict:
-                                inter_dict[key] = (pt, i, t_val)
-        # Check intersections with horizontal lines y = const
-        for y_val in y_lines:
-            if (p1.y - y_val) * (p2.y - y_val) <= 0:
-                if abs(p2.y - p1.y) > 1e-12:
-                    t = (y_val - p1.y) / (p2.y - p1.y)
-                    if 0.0 <= t <= 1.0:
-                        x_int = p1.x + t * (p2.x - p1.x)
-                        if (min(p1.x, p2.x) - 1e-9) <= x_int <= (max(p1.x, p2.x) + 1e-9):
-                            pt = Vector((float(x_int), float(y_val)))
-                            key = (round(pt.x, 8), round(pt.y, 8))
-                            if key not in inter_dict:
-                                inter_dict[key] = (pt, i, t)
-                else:
-                    # Horizontal segment coinciding with grid line; handle endpoints only
-                    if abs(p1.y - y_val) < 1e-9:
-                        for t_val, x_val2 in [(0.0, p1.x), (1.0, p2.x)]:
-                            pt = Vector((float(x_val2), float(y_val)))
-                            key = (round(pt.x, 8), round(pt.y, 8))
-                            if key not in inter_dict:
-                                inter_dict[key] = (pt, i, t_val)
-    # Convert dictionary to list and sort by segment index and parameter
-    inter_list = list(inter_dict.values())
+    start_x, start_y, x_count, y_count = extent
+    p1 = boundary
+    p2 = np.roll(boundary, -1, axis=0)
+    segment_vec = p2 - p1
+    segments = np.arange(len(boundary))
+    # Skip degenerate edges
+    valid = np.hypot(segment_vec[:, 0], segment_vec[:, 1]) >= 1e-12
+    # Intersections as parallel arrays: coordinates, segment index and parameter
+    found_xy = []
+    found_seg = []
+    found_t = []
+    # axis 0 handles vertical lines x = const, axis 1 horizontal lines y = const
+    for axis, start, count in ((0, start_x, x_count), (1, start_y, y_count)):
+        other = 1 - axis
+        lines = start + np.arange(count) * step
+        a1 = p1[:, axis]
+        delta = segment_vec[:, axis]
+        # Segments crossing the lines: emit every line index in their span
+        sloped = valid & (np.abs(delta) > 1e-12)
+        lo = np.searchsorted(lines, np.minimum(a1, p2[:, axis]) - 1e-9 * step, side="left")
+        hi = np.searchsorted(lines, np.maximum(a1, p2[:, axis]) + 1e-9 * step, side="right") - 1
+        counts = np.where(sloped, np.maximum(hi - lo + 1, 0), 0)
+        seg = np.repeat(segments, counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        line = lines[lo[seg] + offsets]
+        t = (line - a1[seg]) / delta[seg]
+        keep = (t >= 0.0) & (t <= 1.0)
+        seg, line, t = seg[keep], line[keep], t[keep]
+        xy = np.empty((len(seg), 2))
+        xy[:, axis] = line
+        xy[:, other] = p1[seg, other] + t * segment_vec[seg, other]
+        found_xy.append(xy)
+        found_seg.append(seg)
+        found_t.append(t)
+        # Segments lying on a grid line; handle intersections at endpoints only
+        k = np.clip(np.round((a1 - start) / step), 0, count - 1).astype(np.int64)
+        along = valid & ~sloped & (np.abs(lines[k] - a1) < 1e-9)
+        seg = np.repeat(segments[along], 2)
+        t = np.tile([0.0, 1.0], int(along.sum()))
+        xy = np.where(t[:, None] == 0.0, p1[seg], p2[seg])
+        xy[:, axis] = lines[k[seg]]
+        found_xy.append(xy)
+        found_seg.append(seg)
+        found_t.append(t)
+    inter_xy = np.concatenate(found_xy)
+    inter_seg = np.concatenate(found_seg)
+    inter_t = np.concatenate(found_t)
     # Sort by segment index, then parameter
-    inter_list.sort(key=lambda x: (x[1], x[2]))
-    return inter_list
-
-def build_grid_mesh(boundary_points: list[Vector], step: float, name: str = "Grid",
-                    extra_points: list[Vector] | None = None,
+    order = np.lexsort((inter_t, inter_seg))
+    inter_xy, inter_seg, inter_t = inter_xy[order], inter_seg[order], inter_t[order]
+    # Deduplicate on a packed int64 key, keeping the first occurrence.  Every
+    # intersection lies on a grid line, so the key is the index of that line
+    # plus the position along it, quantised to step / resolution.  Points on
+    # an x-line (including grid corners) use the first key range, points on
+    # a y-line only the second.
+    resolution = 1 << 20
+    qx = np.rint((inter_xy[:, 0] - start_x) / step * resolution).astype(np.int64)
+    qy = np.rint((inter_xy[:, 1] - start_y) / step * resolution).astype(np.int64)
+    span_x = (x_count - 1) * resolution + 1
+    span_y = (y_count - 1) * resolution + 1
+    on_x_line = qx % resolution == 0
+    keys = np.where(on_x_line,
+                    (qx // resolution) * span_y + qy,
+                    x_count * span_y + (qy // resolution) * span_x + qx)
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    return inter_xy[first], inter_seg[first], inter_t[first]
+
+def build_grid_mesh(boundary_points: np.ndarray, step: float,
+                    extent: tuple[float, float, int, int], name: str = "Grid",
+                    extra_points: np.ndarray | None = None,
                     use_extra_as_boundary: bool = False) -> bpy.types.Object:
     """Construct a grid mesh inside a polygon and link it to the current collection.
 
     Parameters
     ----------
-    boundary_points : list[:class:`mathutils.Vector`]
-        Ordered boundary loop in world XY space.
+    boundary_points : :class:`numpy.ndarray`
+        Array of shape (N, 2) holding the ordered boundary loop in world XY
+        space.
     step : float
         Grid spacing.
+    extent : tuple[float, float, int, int]
+        Grid origin and line counts ``(start_x, start_y, x_count, y_count)``
+        as returned by :func:`compute_grid_extent`.
     name : str, optional
         Name of the new mesh/object.
 
@@ -276,155 +407,124 @@ def build_grid_mesh(boundary_points: list[Vector], step: float, name: str = "Gri
     :class:`bpy.types.Object`
         The newly created object containing the grid mesh.
     """
-    # Determine bounding box
-    xs = [v.x for v in boundary_points]
-    ys = [v.y for v in boundary_points]
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
     # Generate candidate grid points
-    start_x = math.floor(min_x / step) * step
-    end_x = math.ceil(max_x / step) * step
-    start_y = math.floor(min_y / step) * step
-    end_y = math.ceil(max_y / step) * step
-    candidate_points = []
-    x_count = int(round((end_x - start_x) / step)) + 1
-    y_count = int(round((end_y - start_y) / step)) + 1
-    for i in range(x_count):
-        x_val = start_x + i * step
-        for j in range(y_count):
-            y_val = start_y + j * step
-            pt = Vector((x_val, y_val))
-            if point_in_polygon(pt, boundary_points):
-                candidate_points.append(pt)
-
-    # Create a new mesh and object
+    start_x, start_y, x_count, y_count = extent
+    x_lines = start_x + np.arange(x_count) * step
+    y_lines = start_y + np.arange(y_count) * step
+    # Sweep the grid rows once instead of testing every candidate point
+    inside = scanline_inside_mask(boundary_points, x_lines, y_lines)
+    # Dense (i, j) -> mesh vertex index lookup, -1 where the point is outside
+    grid_idx = np.full((x_count, y_count), -1, dtype=np.int32)
+    grid_idx[inside] = np.arange(np.count_nonzero(inside), dtype=np.int32)
+    kept_i, kept_j = np.nonzero(inside)
+    verts = np.zeros((len(kept_i), 3))
+    verts[:, 0] = x_lines[kept_i]
+    verts[:, 1] = y_lines[kept_j]
+    # Horizontal (j, j+1) and vertical (i, i+1) neighbour pairs where both
+    # ends are inside
+    pairs = np.concatenate((
+        np.stack([grid_idx[:, :-1], grid_idx[:, 1:]], -1).reshape(-1, 2),
+        np.stack([grid_idx[:-1, :], grid_idx[1:, :]], -1).reshape(-1, 2),
+    ))
+    grid_edges = pairs[(pairs[:, 0] != -1) & (pairs[:, 1] != -1)]
+
+    # Cells whose four corners are all inside are plain quads.  Build them as
+    # one (n, 4) index buffer so that edgenet_fill only has to solve the
+    # irregular cells along the boundary.
+    quad_cells = (grid_idx[:-1, :-1] != -1) & (grid_idx[1:, :-1] != -1) & \
+        (grid_idx[1:, 1:] != -1) & (grid_idx[:-1, 1:] != -1)
+    quads = np.stack((grid_idx[:-1, :-1][quad_cells], grid_idx[1:, :-1][quad_cells],
+                      grid_idx[1:, 1:][quad_cells], grid_idx[:-1, 1:][quad_cells]), -1)
+
+    # Create a new mesh and object, building the interior grid in one call.
     new_mesh = bpy.data.meshes.new(name)
+    new_mesh.from_pydata(verts.tolist(), grid_edges.tolist(), quads.tolist())
     new_obj = bpy.data.objects.new(name, new_mesh)
     bpy.context.collection.objects.link(new_obj)
     bm_new = bmesh.new()
-
-    # Map from 2D points (rounded) to BMVert objects for grid vertices.
-    vert_map: dict[tuple[float, float], bmesh.types.BMVert] = {}
-    for pt in candidate_points:
-        key = (round(pt.x, 10), round(pt.y, 10))
-        if key not in vert_map:
-            v = bm_new.verts.new((pt.x, pt.y, 0.0))
-            vert_map[key] = v
+    bm_new.from_mesh(new_mesh)
     bm_new.verts.index_update()
     bm_new.verts.ensure_lookup_table()
 
-    # Build a 2D index mapping grid coordinates (i,j) to BMVert
-    grid_map: dict[tuple[int, int], bmesh.types.BMVert] = {}
-    for pt in candidate_points:
-        i = int(round((pt.x - start_x) / step))
-        j = int(round((pt.y - start_y) / step))
-        key = (round(pt.x, 10), round(pt.y, 10))
-        grid_map[(i, j)] = vert_map[key]
-
-    # Create horizontal and vertical edges for the interior grid.  Do not
-    # generate faces yet; faces will be created by the edgenet_fill operator.
-    all_edges: list[bmesh.types.BMEdge] = []
-    # Horizontal edges
-    for i in range(x_count):
-        for j in range(y_count - 1):
-            if (i, j) in grid_map and (i, j + 1) in grid_map:
-                v0 = grid_map[(i, j)]
-                v1 = grid_map[(i, j + 1)]
-                e = bm_new.edges.get((v0, v1)) or bm_new.edges.new((v0, v1))
-                all_edges.append(e)
-    # Vertical edges
-    for i in range(x_count - 1):
-        for j in range(y_count):
-            if (i, j) in grid_map and (i + 1, j) in grid_map:
-                v0 = grid_map[(i, j)]
-                v1 = grid_map[(i + 1, j)]
-                e = bm_new.edges.get((v0, v1)) or bm_new.edges.new((v0, v1))
-                all_edges.append(e)
-
-    # Depending on use_extra_as_boundary flag, decide how to create boundary vertices.
-    boundary_verts: list[bmesh.types.BMVert] = []
-    extra_verts: list[bmesh.types.BMVert] = []
-    if use_extra_as_boundary and extra_points:
+    # Grid edges already shared by two quads are finished; only the rest
+    # takes part in the edge network
+    all_edges: list[bmesh.types.BMEdge] = [e for e in bm_new.edges if not e.is_manifold]
+    # Created edges keyed by sorted vertex indices, so duplicates are skipped
+    # without asking bmesh to search each vertex's edges.
+    edge_set: set[tuple[int, int]] = set()
+
+    def add_edge(v0: bmesh.types.BMVert, v1: bmesh.types.BMVert) -> None:
+        """Create the edge (v0, v1) unless it already exists."""
+        k = (v0.index, v1.index) if v0.index < v1.index else (v1.index, v0.index)
+        if k not in edge_set:
+            edge_set.add(k)
+            all_edges.append(bm_new.edges.new((v0, v1)))
+
+    # Depending on use_extra_as_boundary flag, decide which points become
+    # boundary vertices.
+    has_extra = extra_points is not None and len(extra_points) > 0
+    no_points = np.empty((0, 2))
+    if use_extra_as_boundary and has_extra:
         # Use the provided extra_points as the boundary vertices instead of the
         # original boundary.  These points should already be ordered along the
-        # boundary.  We create verts for each and connect them sequentially.
-        for p in extra_points:
-            bv = bm_new.verts.new((p.x, p.y, 0.0))
-            boundary_verts.append(bv)
-        bm_new.verts.index_update()
-        bm_new.verts.ensure_lookup_table()
-        # Connect boundary verts sequentially to form the outer edge
-        for idx in range(len(boundary_verts)):
-            v0 = boundary_verts[idx]
-            v1 = boundary_verts[(idx + 1) % len(boundary_verts)]
-            e = bm_new.edges.get((v0, v1)) or bm_new.edges.new((v0, v1))
-            all_edges.append(e)
-        # No separate extra verts
+        # boundary.  No separate extra verts.
+        outline = extra_points
+        inner = no_points
     else:
-        # Add original boundary vertices and connect them
-        for p in boundary_points:
-            bv = bm_new.verts.new((p.x, p.y, 0.0))
-            boundary_verts.append(bv)
-        bm_new.verts.index_update()
-        bm_new.verts.ensure_lookup_table()
-        for idx in range(len(boundary_verts)):
-            v0 = boundary_verts[idx]
-            v1 = boundary_verts[(idx + 1) % len(boundary_verts)]
-            e = bm_new.edges.get((v0, v1)) or bm_new.edges.new((v0, v1))
-            all_edges.append(e)
-        # Extra points are treated as additional vertices inside the mesh (e.g. intersection points)
-        if extra_points:
-            for p in extra_points:
-                ev = bm_new.verts.new((p.x, p.y, 0.0))
-                extra_verts.append(ev)
-            bm_new.verts.index_update()
-            bm_new.verts.ensure_lookup_table()
+        # Use the original boundary vertices; extra points are treated as
+        # additional vertices inside the mesh (e.g. intersection points)
+        outline = boundary_points
+        inner = extra_points if has_extra else no_points
+    new_points = np.concatenate((outline, inner)).tolist()
 
     # Connect each boundary vertex and extra intersection vertex to the
     # single nearest interior grid vertex.  This minimizes stray internal
     # diagonals by avoiding connections to multiple grid vertices.
-    def find_nearest_grid_vert(pt: Vector) -> bmesh.types.BMVert | None:
-        """Find the interior grid vertex closest to a given point."""
-        # Estimate grid coordinate using floor to choose an interior cell
-        xi = int(math.floor((pt.x - start_x) / step))
-        yi = int(math.floor((pt.y - start_y) / step))
-        best = None
-        best_dist_sq = None
-        # Search a small neighbourhood around the estimated cell
-        for ii in range(xi - 1, xi + 2):
-            for jj in range(yi - 1, yi + 2):
-                if (ii, jj) in grid_map:
-                    gv = grid_map[(ii, jj)]
-                    dx = gv.co.x - pt.x
-                    dy = gv.co.y - pt.y
-                    dist_sq = dx * dx + dy * dy
-                    if best is None or dist_sq < best_dist_sq:
-                        best = gv
-                        best_dist_sq = dist_sq
-        return best
-
-    for bv in boundary_verts + extra_verts:
-        pt2d = Vector((bv.co.x, bv.co.y))
-        gv = find_nearest_grid_vert(pt2d)
-        if gv is not None and bv != gv:
-            e = bm_new.edges.get((bv, gv)) or bm_new.edges.new((bv, gv))
-            all_edges.append(e)
+    # The interior grid vertices come first in bm_new, in the same order as
+    # ``verts``, so the tree can index straight into bm_new.verts.  Resolve
+    # the targets before adding any vertex so the lookup table built after
+    # from_mesh stays valid and never has to be rebuilt.
+    targets: list[bmesh.types.BMVert | None] = [None] * len(new_points)
+    if len(verts):
+        kd = KDTree(len(verts))
+        for idx, co in enumerate(verts.tolist()):
+            kd.insert(co, idx)
+        kd.balance()
+        bm_verts = bm_new.verts
+        # Only bridge to a grid vertex in the surrounding cells, like the old
+        # window probe did; on a prong narrower than ``step`` the globally
+        # nearest vertex may lie across the outside of the shape.
+        max_dist = 1.5 * step * math.sqrt(2.0)
+        for i, (x, y) in enumerate(new_points):
+            _, idx, dist = kd.find((x, y, 0.0))
+            if dist <= max_dist:
+                targets[i] = bm_verts[idx]
+
+    # Create the vertices, using the returned references directly
+    new_verts: list[bmesh.types.BMVert] = []
+    for x, y in new_points:
+        v = bm_new.verts.new((x, y, 0.0))
+        v.index = len(bm_new.verts) - 1
+        new_verts.append(v)
+    # Connect boundary verts sequentially to form the outer edge
+    for idx in range(len(outline)):
+        add_edge(new_verts[idx], new_verts[(idx + 1) % len(outline)])
+    for v, gv in zip(new_verts, targets):
+        if gv is not None:
+            add_edge(v, gv)
 
     # Prepare and fill the edge network with faces.  This will generate faces
-    # defined by the combined grid, boundary, and bridging edges.  The 'sides'
+    # for the boundary ring between the quads and the outer edge, defined by
+    # the remaining grid, boundary, and bridging edges.  The 'sides'
     # parameter specifies the maximum number of sides per face.  We use 4 to
     # favour quads when possible.
-    bm_new.verts.index_update()
-    bm_new.verts.ensure_lookup_table()
-    bm_new.edges.index_update()
-    bm_new.edges.ensure_lookup_table()
     # Edgenet prepare may add additional edges to close loops
     ret = bmesh.ops.edgenet_prepare(bm_new, edges=all_edges)
-    # Include the newly created edges from the prepare step
-    prepared_edges = ret.get("edges", [])
-    if prepared_edges:
-        all_edges.extend(prepared_edges)  # might not be necessary but safe
-    bmesh.ops.edgenet_fill(bm_new, edges=all_edges, mat_nr=0, use_smooth=False, sides=4)
+    # Include the newly created edges from the prepare step, passing every
+    # edge only once so edgenet_fill does not rescan duplicates.  Indices of
+    # the new edges are not up to date, so dedupe on the BMEdge itself.
+    fill_edges = list(dict.fromkeys(all_edges + ret.get("edges", [])))
+    bmesh.ops.edgenet_fill(bm_new, edges=fill_edges, mat_nr=0, use_smooth=False, sides=4)
 
     # Finish and write to mesh
     bm_new.normal_update()
@@ -448,43 +548,30 @@ def run(step: float = 0.1) -> None:
     depsgraph = bpy.context.evaluated_depsgraph_get()
     obj_eval = obj.evaluated_get(depsgraph)
     mesh_eval = obj_eval.to_mesh()
-    bm = bmesh.new()
-    bm.from_mesh(mesh_eval)
-    bm.verts.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
     # Extract boundary loop
-    boundary = extract_boundary_loop(bm, obj)
+    boundary = extract_boundary_loop(mesh_eval, obj)
     if not boundary:
         print("Unable to find a boundary loop on the selected mesh.")
-        bm.free()
+        obj_eval.to_mesh_clear()
         return
-    # Slice boundary edges at grid lines and obtain ordered intersection points
-    slice_info = slice_boundary_at_grid(boundary, step)
-    # Extract the intersection points in order along the boundary
-    if slice_info:
-        ordered_intersections = [item[0] for item in slice_info]
-    else:
-        ordered_intersections = []
+    # Work on a plain float array instead of mathutils Vectors from here on
+    boundary_xy = np.asarray([(v.x, v.y) for v in boundary], dtype=np.float64)
+    # Slice boundary edges at grid lines and obtain the intersection points,
+    # already ordered along the boundary
+    extent = compute_grid_extent(boundary_xy, step)
+    ordered_intersections, _, _ = slice_boundary_at_grid(boundary_xy, step, extent)
     # Build grid mesh using the original boundary for interior test and the
     # intersection points for the outer boundary.  When use_extra_as_boundary
     # is true, the extra points define the boundary vertices.
-    grid_obj = build_grid_mesh(boundary, step, obj.name + "_grid", extra_points=ordered_intersections,
-                               use_extra_as_boundary=bool(ordered_intersections))
+    grid_obj = build_grid_mesh(boundary_xy, step, extent, obj.name + "_grid", extra_points=ordered_intersections,
+                               use_extra_as_boundary=len(ordered_intersections) > 0)
     # Move the grid object so that it lies in the same plane as the source object
     # We assume the source mesh is planar; align the grid's Z coordinate to the
     # first vertex's world Z value
     if boundary:
-        z_val = (obj.matrix_world @ bm.verts[0].co).z
+        z_val = (obj.matrix_world @ mesh_eval.vertices[0].co).z
         grid_obj.location.z = z_val
-    bm.free()
-
-def is_left(p0: Vector, p1: Vector, p2: Vector) -> float:
-    """Return the z-component of the cross product (p1 - p0) x (p2 - p0).
-
-    Positive when p2 is left of the line p0->p1, negative when right, zero if
-    collinear.
-    """
-    return (p1.x - p0.x) * (p2.y - p0.y) - (p2.x - p0.x) * (p1.y - p0.y)
+    obj_eval.to_mesh_clear()
 
 classes = (
     GridByWorldSettings,
@@ -492,12 +579,12 @@ classes = (
     GRIDIT_OT_GridByWorld
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     bpy.types.Scene.grid_by_world = bpy.props.PointerProperty(type=GridByWorldSettings)
 
 def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
-    del bpy.types.Scene.grid_by_world
\ No newline at end of file
+    del bpy.types.Scene.grid_by_world
+    _unregister_classes()
\ No newline at end of file
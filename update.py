@@ -1,69 +1,303 @@
 import bpy
 import os
-import json
-import zipfile
-import shutil
-import tempfile
-import urllib.request
-import importlib
-import addon_utils
+import re
+import time
+import queue
+import threading
 
 from .manifest import manifest
 from .enums import UpdateChannel
 
 GITHUB_REPO = "Ether0p12348/Blender_GridIt"
+# Install over the directory this package was actually loaded from, so the
+# reload of __package__ picks the new files up (extensions do not live in
+# scripts/addons/<id>)
+ADDON_PATH = os.path.dirname(os.path.abspath(__file__))
+CACHE_FILENAME = "gridit_update_cache.json"
+CHECK_INTERVAL = 3600.0
+RELEASES_PER_PAGE = 30
+REQUEST_TIMEOUT = 10.0
+RESULT_POLL_INTERVAL = 0.5
+PRERELEASE_SUFFIXES = ('-dev', '-beta')
+STARTUP_DELAY = 10.0
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+SPOOL_MAX_SIZE = 64 << 20
+MAX_INSTALL_FILES = 2000
+MAX_INSTALL_BYTES = 64 << 20
+PER_FILE_LIMIT = 16 << 20
+
+_release_cache = None
+_cache_path = None
+_worker_thread = None
+# Downloads handed from the worker thread to the main thread
+_results = queue.Queue()
+_channel = None
+_auto_update = None
+_opener = None
+
+def cache_preferences(channel: UpdateChannel, auto_update: bool):
+    global _channel, _auto_update
+    _channel = channel
+    _auto_update = auto_update
+
+def _get_opener():
+    global _opener
+    import urllib.request
+
+    # Built once and shared by the API poll and the download; GitHub's API also
+    # rejects requests that carry no User-Agent
+    if _opener is None:
+        _opener = urllib.request.build_opener()
+        _opener.addheaders = [("User-Agent", f"{manifest.id}/{manifest.version}")]
+    return _opener
+
+def _norm(version: str) -> tuple[int, ...]:
+    # "v1.2.3-beta" -> (1, 2, 3, 1); the trailing rank orders dev < beta < stable
+    # builds of the same number
+    number, _, suffix = re.sub(r'^v', '', version.strip()).partition('-')
+    parts = [int(p) for p in re.findall(r'\d+', number)][:3]
+    parts += [0] * (3 - len(parts))
+    return (*parts, {"dev": 0, "beta": 1}.get(suffix, 2))
+
+def _load_cache() -> dict:
+    global _release_cache, _cache_path
+    import json
+
+    if _release_cache is None:
+        # First called from register() on the main thread, so the worker thread
+        # never has to touch bpy to find the cache file
+        _cache_path = os.path.join(bpy.utils.user_resource("CONFIG", create=True), CACHE_FILENAME)
+        # "channels" maps each channel to its newest matching tag and when it was checked
+        _release_cache = {"etag": None, "last_modified": None, "payload": None, "channels": {}}
+        try:
+            with open(_cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = None
+        # The file outlives any one version of the add-on and may be damaged
+        # or in an older format; keep only what still has the expected shape
+        if isinstance(data, dict) and isinstance(data.get("channels"), dict):
+            _release_cache["channels"] = {
+                name: entry for name, entry in data["channels"].items()
+                if isinstance(entry, dict)
+            }
+            payload = data.get("payload")
+            if isinstance(payload, list) and all(
+                isinstance(release, dict) and "prerelease" in release
+                and isinstance(release.get("tag_name"), str) and isinstance(release.get("zipball_url"), str)
+                for release in payload
+            ):
+                # The validators only make sense together with the payload they describe
+                _release_cache["payload"] = payload
+                _release_cache["etag"] = data.get("etag") if isinstance(data.get("etag"), str) else None
+                _release_cache["last_modified"] = (
+                    data.get("last_modified") if isinstance(data.get("last_modified"), str) else None
+                )
+    return _release_cache
+
+def _save_cache(cache: dict):
+    import json
+
+    # Write next to the real file and rename it over, so a crash mid-write
+    # never leaves a truncated cache behind
+    temp_path = _cache_path + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(temp_path, _cache_path)
+    except OSError as e:
+        print(f"[{manifest.name}] Could not write update cache: {e}")
+
+def _checked_at(entry: dict | None) -> float:
+    checked = entry.get("checked", 0.0) if entry else 0.0
+    return float(checked) if isinstance(checked, (int, float)) else 0.0
+
+def _seconds_since_last_check(channel: UpdateChannel | None = None) -> float:
+    # Wall-clock time, since the timestamp has to survive a Blender restart
+    channels = _load_cache()["channels"]
+    if channel is not None:
+        checked = _checked_at(channels.get(channel.value))
+    else:
+        checked = max((_checked_at(entry) for entry in channels.values()), default=0.0)
+    return max(0.0, time.time() - checked)
 
 def get_latest_release(channel: UpdateChannel) -> dict | None:
-    api_url = f"https://api.github.com/repos/{GITHUB_REPO}/releases"
+    import gzip
+    import json
+    import urllib.request
+    import urllib.error
+
+    api_url = f"https://api.github.com/repos/{GITHUB_REPO}/releases?per_page={RELEASES_PER_PAGE}"
+    cache = _load_cache()
+    request = urllib.request.Request(api_url, headers={
+        "Accept": "application/vnd.github+json",
+        "Accept-Encoding": "gzip",
+    })
+    if cache["payload"] is not None:
+        # Conditional GET: GitHub answers 304 with an empty body when nothing changed
+        if cache["etag"]:
+            request.add_header("If-None-Match", cache["etag"])
+        if cache["last_modified"]:
+            request.add_header("If-Modified-Since", cache["last_modified"])
     try:
-        with urllib.request.urlopen(api_url) as response:
-            releases = json.loads(response.read().decode())
+        with _get_opener().open(request, timeout=REQUEST_TIMEOUT) as response:
+            # Parse straight from the stream instead of holding bytes, str and objects at once
+            if response.headers.get("Content-Encoding") == "gzip":
+                with gzip.GzipFile(fileobj=response) as body:
+                    releases = json.load(body)
+            else:
+                releases = json.load(response)
+            cache["etag"] = response.headers.get("ETag")
+            cache["last_modified"] = response.headers.get("Last-Modified")
+        # Only the fields the channel scan reads are kept for the next 304
+        cache["payload"] = [
+            {key: release[key] for key in ("tag_name", "prerelease", "zipball_url")}
+            for release in releases
+        ]
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or cache["payload"] is None:
+            print(f"[{manifest.name}] Failed to fetch releases: {e}")
+            return None
+        releases = cache["payload"]
     except Exception as e:
         print(f"[{manifest.name}] Failed to fetch releases: {e}")
         return None
 
+    # Pick the channel's test once instead of re-evaluating every case per release
+    is_stable = lambda tag, prerelease: not prerelease and not tag.endswith(PRERELEASE_SUFFIXES)
+    matches = {
+        UpdateChannel.DEV: lambda tag, prerelease: tag.endswith('-dev'),
+        UpdateChannel.BETA: lambda tag, prerelease: tag.endswith('-beta') or is_stable(tag, prerelease),
+        UpdateChannel.STABLE: is_stable,
+    }[channel]
+
+    latest = None
     for release in releases:
-        tag = release['tag_name']
-        is_prerelease = release['prerelease']
-        is_dev = tag.endswith('-dev')
-        is_beta = tag.endswith('-beta')
-        is_stable = not is_prerelease and not is_beta and not is_dev
-
-        if (
-            channel == UpdateChannel.DEV and is_dev or
-            channel == UpdateChannel.BETA and (is_beta or is_stable) or
-            channel == UpdateChannel.STABLE and is_stable
-        ):
-            return {
-                "tag": tag,
+        if matches(release['tag_name'], release['prerelease']):
+            latest = {
+                "tag": release['tag_name'],
                 "zip_url": release['zipball_url'],
             }
+            break
+
+    cache["channels"][channel.value] = {
+        "tag": latest["tag"] if latest else None,
+        "checked": time.time(),
+    }
+    _save_cache(cache)
+    return latest
+
+def _extract_update(archive, staging: str):
+    import shutil
+    import zipfile
+
+    with zipfile.ZipFile(archive, "r") as zip_ref:
+        # Validate the whole archive from its directory before writing anything
+        infos = zip_ref.infolist()
+        if not infos:
+            raise Exception("Update archive is empty")
+        if len(infos) > MAX_INSTALL_FILES:
+            raise Exception(f"Update archive has too many entries ({len(infos)})")
+        if sum(info.file_size for info in infos) > MAX_INSTALL_BYTES:
+            raise Exception("Update archive is too large")
+        if any(info.file_size > PER_FILE_LIMIT for info in infos):
+            raise Exception("Update archive contains an oversized file")
 
-    return None
+        # GitHub zipballs wrap everything in a single "<owner>-<repo>-<sha>/"
+        # folder; detect it once and strip it from every entry
+        prefix = infos[0].filename.split("/", 1)[0] + "/"
+        if not all(info.filename.startswith(prefix) for info in infos):
+            raise Exception("Update archive has no single top-level folder")
+        # Members are joined onto the staging dir by hand, so refuse anything
+        # that would land outside it (extractall used to sanitise these)
+        for info in infos:
+            rel = info.filename[len(prefix):]
+            if os.path.isabs(rel) or rel.startswith(("/", "\\")) or os.path.normpath(rel).split(os.sep, 1)[0] == "..":
+                raise Exception(f"Update archive contains an unsafe path: {info.filename}")
 
-def download_and_install_update(tag: str, zip_url: str) -> bool:
+        shutil.rmtree(staging, ignore_errors=True)
+
+        # One buffer for every entry; readinto avoids a new bytes object per read
+        buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+        view = memoryview(buffer)
+        # Sorted entries keep each directory's files together, so makedirs
+        # only runs when the parent directory changes
+        infos.sort(key=lambda info: info.filename)
+        last_dir = None
+        try:
+            for info in infos:
+                if info.is_dir():
+                    continue
+                rel = info.filename[len(prefix):]
+                target = os.path.join(staging, rel)
+                target_dir = os.path.dirname(target)
+                if target_dir != last_dir:
+                    os.makedirs(target_dir, exist_ok=True)
+                    last_dir = target_dir
+                with zip_ref.open(info) as src, open(target, "wb") as dst:
+                    while True:
+                        n = src.readinto(buffer)
+                        if not n:
+                            break
+                        dst.write(view[:n])
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+def download_update(tag: str, zip_url: str) -> dict | None:
+    import shutil
+    import tempfile
+    import urllib.request
+
+    buffer = None
     try:
         print(f"[{manifest.name}] Downloading update {tag} from {zip_url}")
-        temp_dir = tempfile.mkdtemp()
-        zip_path = os.path.join(temp_dir, "update.zip")
+        # Release zips are small enough to stay in memory; the spooled file
+        # only falls back to disk for unusually large archives
+        buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
 
-        urllib.request.urlretrieve(zip_url, zip_path)
+        # Stream with a 1 MiB buffer; urlretrieve copies in 8 KiB blocks
+        request = urllib.request.Request(zip_url, headers={"Accept-Encoding": "identity"})
+        with _get_opener().open(request, timeout=REQUEST_TIMEOUT) as response:
+            shutil.copyfileobj(response, buffer, length=DOWNLOAD_CHUNK_SIZE)
+        buffer.seek(0)
 
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(temp_dir)
+        # Extract next to the add-on, still off the main thread; install_update
+        # then only has to swap it in with renames, so a failure part-way
+        # through never leaves a half-written install behind
+        staging = ADDON_PATH + ".new"
+        _extract_update(buffer, staging)
 
-        extracted_dirs = [d for d in os.listdir(temp_dir) if os.path.isdir(os.path.join(temp_dir, d))]
-        if not extracted_dirs:
-            raise Exception("Update archive is empty")
+        return {
+            "tag": tag,
+            "staging": staging,
+        }
+
+    except Exception as e:
+        print(f"[{manifest.name}] Update Failed: {e}")
+        return None
 
-        addons_path = bpy.utils.user_resource("SCRIPTS", "addons")
-        addon_name = manifest.id
-        addon_path = os.path.join(addons_path, addon_name)
+    finally:
+        if buffer is not None:
+            buffer.close()
 
-        if os.path.exists(addon_path):
-            shutil.rmtree(addon_path)
+def install_update(download: dict) -> bool:
+    import shutil
 
-        shutil.copytree(os.path.join(temp_dir, extracted_dirs[0]), addon_path) # addon_path may become a problem
+    staging = download["staging"]
+    addon_path = ADDON_PATH
+    old = addon_path + ".old"
+    try:
+        shutil.rmtree(old, ignore_errors=True)
+        if os.path.exists(addon_path):
+            os.replace(addon_path, old)
+        try:
+            os.replace(staging, addon_path)
+        except OSError:
+            if os.path.exists(old):
+                os.replace(old, addon_path)
+            raise
+        shutil.rmtree(old, ignore_errors=True)
 
         print(f"[{manifest.name}] Update installed. Reloading add-on...")
         bpy.app.timers.register(reload_addon, first_interval=1.0)
@@ -71,56 +305,119 @@ def download_and_install_update(tag: str, zip_url: str) -> bool:
 
     except Exception as e:
         print(f"[{manifest.name}] Update Failed: {e}")
+        shutil.rmtree(staging, ignore_errors=True)
         return False
 
-def check_for_updates(force: bool = False) -> float:
-    print("[GridIt] check_for_updates function ENTERED")
-    try:
-        wm = bpy.context.window_manager
-        channel_str = getattr(wm, "gridit_update_channel_sel", UpdateChannel.STABLE.value)
-        auto_update = getattr(wm, "gridit_auto_update", True)
-        channel = UpdateChannel(channel_str)
-    except Exception as e:
-        print(f"[{manifest.name}] Could not load preferences: {e}")
-        return 3600.0
-
-    print(f"[{manifest.name}] Checking for updates on '{channel}' channel...")
+def _check_worker(channel: UpdateChannel, auto_update: bool, force: bool):
+    # Runs off the main thread: network and extraction only, no bpy data access
     current_version = manifest.version
 
     release = get_latest_release(channel)
-    if release and release["tag"] != current_version:
+    if release and _norm(release["tag"]) > _norm(current_version):
         print(f"[{manifest.name}] New update available: {release['tag']}")
         if force or auto_update:
-            download_and_install_update(release["tag"], release["zip_url"])
+            download = download_update(release["tag"], release["zip_url"])
+            if download:
+                # bpy (timers included) is not thread-safe; _drain_results
+                # picks this up on the main thread
+                _results.put(download)
 
     else:
         print(f"[{manifest.name}] No updates available.")
 
-    return 3600.0
+def _drain_results():
+    # Main-thread timer that polls for the worker's result and stops once the
+    # worker has finished
+    # Sample liveness first so a result queued just before the worker exits
+    # is still drained below
+    alive = _worker_thread is not None and _worker_thread.is_alive()
+    while not _results.empty():
+        install_update(_results.get_nowait())
+    return RESULT_POLL_INTERVAL if alive else None
+
+def check_for_updates(force: bool = False) -> float:
+    global _worker_thread
+    print("[GridIt] check_for_updates function ENTERED")
+    # The preference properties keep these in sync through their update
+    # callbacks; only the first run has to go through RNA
+    if _channel is None or _auto_update is None:
+        try:
+            wm = bpy.context.window_manager
+            channel_str = getattr(wm, "gridit_update_channel_sel", UpdateChannel.STABLE.value)
+            auto_update = getattr(wm, "gridit_auto_update", True)
+            cache_preferences(UpdateChannel(channel_str), auto_update)
+        except Exception as e:
+            print(f"[{manifest.name}] Could not load preferences: {e}")
+            return CHECK_INTERVAL
+    channel = _channel
+    auto_update = _auto_update
+
+    # Fast path: this channel was checked within the interval and its newest tag
+    # is not ahead of us (or would not be installed anyway), so skip the worker
+    elapsed = _seconds_since_last_check(channel)
+    if not force and elapsed < CHECK_INTERVAL:
+        known_tag = _load_cache()["channels"][channel.value].get("tag")
+        if not auto_update or not isinstance(known_tag, str) or _norm(known_tag) <= _norm(manifest.version):
+            return CHECK_INTERVAL - elapsed
+
+    if _worker_thread is not None and _worker_thread.is_alive():
+        print(f"[{manifest.name}] An update check is already running.")
+        return CHECK_INTERVAL
+
+    print(f"[{manifest.name}] Checking for updates on '{channel}' channel...")
+    _worker_thread = threading.Thread(target=_check_worker, args=(channel, auto_update, force), daemon=True)
+    _worker_thread.start()
+    if not bpy.app.timers.is_registered(_drain_results):
+        bpy.app.timers.register(_drain_results, first_interval=RESULT_POLL_INTERVAL)
+
+    return CHECK_INTERVAL
 
 def reload_addon():
+    import sys
+    import importlib
+
     print("[GridIt] reload_addon function ENTERED")
-    addon_name = manifest.id
+    # The add-on is loaded under its extension package path (bl_ext.<repo>.<id>),
+    # not under the bare manifest id
+    package = __package__
+    module = sys.modules.get(package)
 
-    if addon_name in bpy.context.preferences.addons:
-        module = bpy.context.preferences.addons[addon_name].module
+    if module is not None:
         try:
             if hasattr(module, "unregister"):
                 module.unregister()
 
-            importlib.reload(module)
+            # importlib.reload only re-executes the top package; drop every
+            # submodule too so the next import picks up the installed files
+            for name in [m for m in sys.modules if m == package or m.startswith(package + ".")]:
+                del sys.modules[name]
+            importlib.invalidate_caches()
+            module = importlib.import_module(package)
 
             if hasattr(module, "register"):
                 module.register()
 
-            print(f"[{manifest.name}] Reloaded add-on: {addon_name}")
+            print(f"[{manifest.name}] Reloaded add-on: {package}")
         except Exception as e:
             print(f"[{manifest.name}] Error reloading add-on: {e}")
     else:
         print(f"[{manifest.name}] Add-on not found for reloading.")
 
+def _scheduled_check():
+    return check_for_updates(force=False)
+
 def register():
-    bpy.app.timers.register(lambda: check_for_updates(force=False), first_interval=10.0)
+    try:
+        first_interval = max(STARTUP_DELAY, CHECK_INTERVAL - _seconds_since_last_check())
+    except Exception as e:
+        # A cache problem must never keep the add-on from being enabled
+        print(f"[{manifest.name}] Could not read update cache: {e}")
+        first_interval = STARTUP_DELAY
+    bpy.app.timers.register(_scheduled_check, first_interval=first_interval)
 
 def unregister():
-    pass
\ No newline at end of file
+    # A reload registers a fresh timer from the new module; stop this one
+    if bpy.app.timers.is_registered(_scheduled_check):
+        bpy.app.timers.unregister(_scheduled_check)
+    if bpy.app.timers.is_registered(_drain_results):
+        bpy.app.timers.unregister(_drain_results)